@@ -7,6 +7,7 @@ setup(
     packages=find_packages(where="src"),
     install_requires=[
         "nbtlib>=1.12.1",
+        "numpy>=1.20",
         "gnureadline>=6.3.8",
     ],
     entry_points={
@@ -1,9 +1,10 @@
 """Configuration management for NBT viewer."""
-import json
 import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+from src.utils.json_io import json_dumps, json_loads
+
 # Default configuration values
 DEFAULT_CONFIG = {
     "nbt_file": "resources/David_0_0.nbt",
@@ -25,7 +26,20 @@ class ConfigManager:
             config_file: Path to configuration file. If None, uses default location.
         """
         self.config_file = config_file or os.path.join("resources", "config.json")
-        self.config = self._load_config()
+        self._dirty = False
+        self._last_saved_text: Optional[str] = None
+        self._config: Optional[Dict[str, Any]] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration dictionary, loaded from disk on first access."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        self._config = value
         
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file or create default if not exists.
@@ -35,12 +49,12 @@ class ConfigManager:
         """
         try:
             with open(self.config_file, "r") as f:
-                config = json.load(f)
+                config = json_loads(f.read())
                 # Merge with defaults to ensure all required keys exist
                 return {**DEFAULT_CONFIG, **config}
         except FileNotFoundError:
             return self._create_default_config()
-        except json.JSONDecodeError:
+        except ValueError:
             print(f"Warning: Config file {self.config_file} is corrupted. Using defaults.")
             return self._create_default_config()
 
@@ -52,14 +66,9 @@ class ConfigManager:
         """
         # Create resources directory if it doesn't exist
         os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-        
-        # Create required directories
-        for directory in [
-            DEFAULT_CONFIG["output_directory"],
-            DEFAULT_CONFIG["backup_directory"]
-        ]:
-            os.makedirs(directory, exist_ok=True)
-            
+
+        self._ensure_all_dirs(DEFAULT_CONFIG)
+
         # Save default configuration
         self.save_config(DEFAULT_CONFIG)
         return DEFAULT_CONFIG.copy()
@@ -71,9 +80,18 @@ class ConfigManager:
             config: Configuration dictionary to save
         """
         try:
-            with open(self.config_file, "w") as f:
-                json.dump(config, f, indent=4)
+            text = json_dumps(config, indent=4)
+            # Identical content was already written; skip the disk round-trip
+            if text != self._last_saved_text:
+                # Write to a sibling temp file and rename so a crash
+                # mid-write can never leave a truncated config behind
+                tmp_file = self.config_file + ".tmp"
+                with open(tmp_file, "w") as f:
+                    f.write(text)
+                os.replace(tmp_file, self.config_file)
+                self._last_saved_text = text
             self.config = config
+            self._dirty = False
         except Exception as e:
             print(f"Error saving configuration: {str(e)}")
 
@@ -95,16 +113,30 @@ class ConfigManager:
             key: Configuration key to set
             value: Value to set
         """
+        if key in self.config and self.config[key] == value:
+            return
         self.config[key] = value
+        self._dirty = True
         self.save_config(self.config)
 
+    def flush(self) -> None:
+        """Write the configuration to disk if it has unsaved changes."""
+        if self._dirty:
+            self.save_config(self.config)
+
     def update(self, updates: Dict[str, Any]) -> None:
         """Update multiple configuration values at once.
         
         Args:
             updates: Dictionary of configuration updates
         """
+        if all(
+            key in self.config and self.config[key] == value
+            for key, value in updates.items()
+        ):
+            return
         self.config.update(updates)
+        self._dirty = True
         self.save_config(self.config)
 
     def reset(self) -> None:
@@ -118,20 +150,38 @@ class ConfigManager:
         Returns:
             Dictionary of path keys and their existence status
         """
+        keys = ['nbt_file', 'progress_file', 'output_directory', 'backup_directory']
+        # Stat each distinct path once; several keys may share a path
+        stat_results: Dict[str, bool] = {}
         path_status = {}
-        for key in ['nbt_file', 'progress_file', 'output_directory', 'backup_directory']:
+        for key in keys:
             path = self.config.get(key)
-            if path:
-                path_status[key] = os.path.exists(path)
+            if not path:
+                continue
+            if path not in stat_results:
+                try:
+                    os.stat(path)
+                    stat_results[path] = True
+                except OSError:
+                    stat_results[path] = False
+            path_status[key] = stat_results[path]
         return path_status
 
+    def _ensure_all_dirs(self, config: Dict[str, Any]) -> None:
+        """Create the configured directories that don't exist yet.
+
+        Args:
+            config: Configuration dictionary to read directory paths from
+        """
+        # The set dedups keys that point at the same directory; isdir keeps
+        # the warm path to a single stat each
+        for directory in {config['output_directory'], config['backup_directory']}:
+            if not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
+
     def ensure_directories(self) -> None:
         """Ensure all required directories exist."""
-        for directory in [
-            self.config['output_directory'],
-            self.config['backup_directory']
-        ]:
-            os.makedirs(directory, exist_ok=True)
+        self._ensure_all_dirs(self.config)
 
     def get_absolute_path(self, key: str) -> Optional[str]:
         """Get absolute path for a configuration path value.
@@ -156,10 +206,11 @@ class ConfigManager:
         nbt_file = self.get('nbt_file')
         if not nbt_file:
             return False
-        
+
         try:
-            return os.path.exists(nbt_file) and os.access(nbt_file, os.R_OK)
-        except Exception:
+            # One stat covers both the exists and readability checks
+            return bool(os.stat(nbt_file).st_mode & 0o444)
+        except OSError:
             return False
 
     @property
@@ -1,8 +1,16 @@
 """Models for managing NBT chunk data."""
 
-from collections import defaultdict
 import string
-from typing import Dict, List, Tuple, DefaultDict, Any
+from typing import Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+
+# Pre-rendered reference strings covering the practical mapart range, so the
+# per-block loader does a table lookup instead of formatting a new string.
+_CHUNK_REFS = [
+    [f"{letter}{x + 1}" for x in range(64)] for letter in string.ascii_uppercase
+]
 
 
 def get_chunk_reference(chunk_x: int, chunk_z: int) -> str:
@@ -15,9 +23,9 @@ def get_chunk_reference(chunk_x: int, chunk_z: int) -> str:
     Returns:
         String reference in format like 'A1'
     """
-    letter = string.ascii_uppercase[chunk_z]
-    number = chunk_x + 1
-    return f"{letter}{number}"
+    if chunk_x < 64:
+        return _CHUNK_REFS[chunk_z][chunk_x]
+    return f"{string.ascii_uppercase[chunk_z]}{chunk_x + 1}"
 
 
 def get_chunk_coordinates_from_reference(reference: str) -> Tuple[int, int]:
@@ -29,29 +37,41 @@ def get_chunk_coordinates_from_reference(reference: str) -> Tuple[int, int]:
     Returns:
         Tuple of (chunk_x, chunk_z) coordinates
     """
-    letter = reference[0].upper()
-    number = int(reference[1:])
-    chunk_z = string.ascii_uppercase.index(letter)
-    chunk_x = number - 1
+    # ord arithmetic instead of scanning ascii_uppercase for the letter
+    chunk_z = ord(reference[0].upper()) - ord("A")
+    chunk_x = int(reference[1:]) - 1
     return chunk_x, chunk_z
 
 
 class Block:
-    """Represents a single block in the NBT structure."""
+    """Represents a single block in the NBT structure.
+
+    Blocks are lightweight views over a chunk's arrays: they carry
+    coordinates plus an index into a shared palette of type names.
+    """
+
+    __slots__ = ("x", "y", "z", "type_id", "palette")
 
-    def __init__(self, x: int, y: int, z: int, block_type: str):
+    def __init__(self, x: int, y: int, z: int, type_id: int, palette: List[str]):
         """Initialize a block.
 
         Args:
             x: Relative x coordinate within chunk
             y: Y coordinate
             z: Relative z coordinate within chunk
-            block_type: Type of block (e.g., 'stone')
+            type_id: Index of the block's type in the palette
+            palette: Shared list of block type names (e.g., 'stone')
         """
         self.x = x
         self.y = y
         self.z = z
-        self.block_type = block_type.replace("minecraft:", "")
+        self.type_id = type_id
+        self.palette = palette
+
+    @property
+    def block_type(self) -> str:
+        """Get the name of this block's type."""
+        return self.palette[self.type_id]
 
     @property
     def relative_pos(self) -> Tuple[int, int, int]:
@@ -64,25 +84,82 @@ class Block:
 
 
 class Chunk:
-    """Represents a 16x16 chunk of blocks."""
+    """Represents a 16x16 chunk of blocks.
 
-    def __init__(self, chunk_ref: str):
+    Block data is held as parallel coordinate/type arrays (structure of
+    arrays) instead of one Python object per block; Block instances are
+    only materialized on demand by get_row.
+    """
+
+    def __init__(self, chunk_ref: str, palette: Optional[List[str]] = None):
         """Initialize a chunk.
 
         Args:
             chunk_ref: Reference string for the chunk (e.g., 'A1')
+            palette: Shared list of block type names indexed by type id
         """
         self.chunk_ref = chunk_ref
-        self.blocks_by_row: DefaultDict[int, List[Block]] = defaultdict(list)
         self.coordinates = get_chunk_coordinates_from_reference(chunk_ref)
+        self.palette: List[str] = palette if palette is not None else []
+        self.xs = np.empty(0, dtype=np.int8)
+        self.ys = np.empty(0, dtype=np.int16)
+        self.zs = np.empty(0, dtype=np.int8)
+        self.type_ids = np.empty(0, dtype=np.int32)
+        # Row r occupies array positions [_row_bounds[r], _row_bounds[r + 1])
+        self._row_bounds = [0] * 17
+
+    def set_blocks(self, xs: Any, ys: Any, zs: Any, type_ids: Any) -> None:
+        """Adopt pre-built parallel block arrays for this chunk.
+
+        Args:
+            xs: Relative x coordinates within the chunk
+            ys: Y coordinates
+            zs: Relative z coordinates (row numbers) within the chunk
+            type_ids: Indices into the shared palette
+        """
+        self.xs = np.asarray(xs, dtype=np.int8)
+        self.ys = np.asarray(ys, dtype=np.int16)
+        self.zs = np.asarray(zs, dtype=np.int8)
+        self.type_ids = np.asarray(type_ids, dtype=np.int32)
+        self._sort_blocks()
+
+    def _sort_blocks(self) -> None:
+        """Sort the block arrays by (row, x) so row reads never re-sort."""
+        order = np.lexsort((self.xs, self.zs))
+        self.xs = self.xs[order]
+        self.ys = self.ys[order]
+        self.zs = self.zs[order]
+        self.type_ids = self.type_ids[order]
+        # With rows bounded 0-15, a fixed table of slice bounds replaces
+        # any per-row membership scan
+        self._row_bounds = np.searchsorted(self.zs, np.arange(17)).tolist()
 
     def add_block(self, block: Block) -> None:
-        """Add a block to the chunk.
+        """Add a single block to the chunk.
+
+        Convenience path for incremental edits; bulk loading goes through
+        set_blocks.
 
         Args:
             block: Block instance to add
         """
-        self.blocks_by_row[block.z].append(block)
+        if block.palette is self.palette:
+            type_id = block.type_id
+        else:
+            try:
+                type_id = self.palette.index(block.block_type)
+            except ValueError:
+                self.palette.append(block.block_type)
+                type_id = len(self.palette) - 1
+        self.xs = np.append(self.xs, np.int8(block.x))
+        self.ys = np.append(self.ys, np.int16(block.y))
+        self.zs = np.append(self.zs, np.int8(block.z))
+        self.type_ids = np.append(self.type_ids, np.int32(type_id))
+        self._sort_blocks()
+
+    def _row_slice(self, row_num: int) -> slice:
+        """Get the array slice covering a row's blocks, in x order."""
+        return slice(self._row_bounds[row_num], self._row_bounds[row_num + 1])
 
     def get_row(self, row_num: int) -> List[Block]:
         """Get all blocks in a specific row.
@@ -91,9 +168,18 @@ class Chunk:
             row_num: Row number to retrieve (0-15)
 
         Returns:
-            List of blocks in the row
+            List of blocks in the row, sorted by x coordinate
         """
-        return sorted(self.blocks_by_row[row_num], key=lambda b: b.x)
+        sel = self._row_slice(row_num)
+        return [
+            Block(x, y, z, t, self.palette)
+            for x, y, z, t in zip(
+                self.xs[sel].tolist(),
+                self.ys[sel].tolist(),
+                self.zs[sel].tolist(),
+                self.type_ids[sel].tolist(),
+            )
+        ]
 
     def to_dict(self) -> Dict[int, List[Dict]]:
         """Convert chunk data to dictionary format.
@@ -101,10 +187,21 @@ class Chunk:
         Returns:
             Dictionary of row numbers to lists of block data
         """
-        return {
-            row: [block.to_dict() for block in blocks]
-            for row, blocks in self.blocks_by_row.items()
-        }
+        result: Dict[int, List[Dict]] = {}
+        for row in range(16):
+            sel = self._row_slice(row)
+            if sel.start == sel.stop:
+                continue
+            result[row] = [
+                {"relative_pos": (x, y, z), "block_type": self.palette[t]}
+                for x, y, z, t in zip(
+                    self.xs[sel].tolist(),
+                    self.ys[sel].tolist(),
+                    self.zs[sel].tolist(),
+                    self.type_ids[sel].tolist(),
+                )
+            ]
+        return result
 
 
 class ChunkManager:
@@ -127,30 +224,52 @@ class ChunkManager:
         """
         blocks = nbt_file.get("blocks", [])
         palette = nbt_file.get("palette", {})
-
-        for block_data in blocks:
-            pos = block_data["pos"]
-            state = block_data["state"]
-            x, y, z = [int(coord) for coord in pos]
-
-            # Calculate chunk coordinates
-            chunk_x, chunk_z = x // 16, z // 16
-            chunk_ref = get_chunk_reference(chunk_x, chunk_z)
-
-            # Calculate relative coordinates within chunk
-            relative_x = x % 16
-            relative_z = z % 16
-
-            # Get block type from palette
-            block_type = palette[state]["Name"]
-
-            # Create or get chunk
-            if chunk_ref not in self.chunks:
-                self.chunks[chunk_ref] = Chunk(chunk_ref)
-
-            # Create and add block
-            block = Block(relative_x, y, relative_z, block_type)
-            self.chunks[chunk_ref].add_block(block)
+        count = len(blocks)
+        if not count:
+            return
+
+        # Pull positions and palette indices into one packed array in a
+        # single pass, so each block entry is touched exactly once and the
+        # coordinate math runs vectorized instead of once per block.
+        packed = np.fromiter(
+            (
+                value
+                for block_data in blocks
+                for value in (*block_data["pos"], block_data["state"])
+            ),
+            dtype=np.int32,
+            count=4 * count,
+        ).reshape(-1, 4)
+
+        xs, ys, zs, states = packed[:, 0], packed[:, 1], packed[:, 2], packed[:, 3]
+        # Structure coordinates are non-negative, so shift/mask is a safe
+        # (and branch-free) replacement for floor division and modulo
+        relative_xs = xs & 15
+        relative_zs = zs & 15
+
+        # One shared palette of cleaned type names; blocks carry int ids.
+        palette_names = [
+            str(entry["Name"]).replace("minecraft:", "") for entry in palette
+        ]
+
+        # Bucket blocks per chunk in one pass: stable-sort by a combined
+        # chunk key, then slice out each chunk's run of block indices.
+        chunk_keys = (xs >> 4).astype(np.int64) * 32 + (zs >> 4)
+        order = np.argsort(chunk_keys, kind="stable")
+        unique_keys, run_starts = np.unique(chunk_keys[order], return_index=True)
+        run_bounds = run_starts.tolist() + [count]
+
+        for run, key in enumerate(unique_keys.tolist()):
+            chunk_ref = get_chunk_reference(key // 32, key % 32)
+            selection = order[run_bounds[run] : run_bounds[run + 1]]
+            chunk = Chunk(chunk_ref, palette_names)
+            chunk.set_blocks(
+                relative_xs[selection],
+                ys[selection],
+                relative_zs[selection],
+                states[selection],
+            )
+            self.chunks[chunk_ref] = chunk
 
     def get_chunk(self, chunk_ref: str) -> Chunk:
         """Get a specific chunk by reference.
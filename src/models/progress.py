@@ -1,9 +1,26 @@
 """Model for tracking progress through chunks."""
-import json
+import atexit
 import os
+import threading
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
+from src.utils.json_io import json_dumps, json_loads
+
+# Formatted timestamp cached for the current second; bursts of mutations
+# reuse it instead of reformatting a datetime each time
+_now_cache = (-1, "")
+
+
+def _now_iso() -> str:
+    """Get the current local time as an ISO string, cached per second."""
+    global _now_cache
+    second = int(time.time())
+    if second != _now_cache[0]:
+        _now_cache = (second, datetime.now().isoformat(timespec="seconds"))
+    return _now_cache[1]
+
 
 class ProgressTracker:
     """Tracks completion progress of chunks and rows."""
@@ -21,13 +38,29 @@ class ProgressTracker:
             "completed_chunks": [],  # List of completed chunks
             "last_modified": {},  # Timestamp of last modification
         }
+        # In-memory row state is one 16-bit mask per chunk and completed
+        # chunks are a set; the JSON file keeps the legacy list formats
+        self._row_masks: Dict[str, int] = {}
+        self._completed_chunks: set = set()
+        # Running total of set bits across all masks, so stats never rescan
+        self._completed_row_count = 0
+        # Memoized row lists keyed by the mask they were built from
+        self._rows_cache: Dict[str, tuple] = {}
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+        # Reentrant so flush can call save_progress while holding it; guards
+        # the masks, set, and progress dict against the timer thread
+        self._lock = threading.RLock()
         self.load_progress()
+        # Coalesced saves are flushed on interpreter exit so a normal quit
+        # never loses the tail of a marking burst
+        atexit.register(self.flush)
 
     def load_progress(self) -> None:
         """Load progress from save file."""
         try:
             with open(self.save_file, "r") as f:
-                loaded_progress = json.load(f)
+                loaded_progress = json_loads(f.read())
                 # Update progress while preserving structure
                 self.progress["completed_rows"].update(loaded_progress.get("completed_rows", {}))
                 self.progress["completed_chunks"].extend(loaded_progress.get("completed_chunks", []))
@@ -35,16 +68,74 @@ class ProgressTracker:
         except FileNotFoundError:
             # File doesn't exist yet, use default empty progress
             pass
-        except json.JSONDecodeError:
+        except ValueError:
             print(f"Warning: Progress file {self.save_file} is corrupted. Using empty progress.")
+        self._row_masks = {
+            ref: sum(1 << row for row in rows)
+            for ref, rows in self.progress["completed_rows"].items()
+        }
+        self._completed_chunks = set(self.progress["completed_chunks"])
+        self._completed_row_count = sum(
+            mask.bit_count() for mask in self._row_masks.values()
+        )
 
-    def save_progress(self) -> None:
-        """Save progress to file."""
-        try:
-            with open(self.save_file, "w") as f:
-                json.dump(self.progress, f, indent=4)
-        except Exception as e:
-            print(f"Error saving progress: {str(e)}")
+    def _schedule_save(self) -> None:
+        """Mark progress dirty and start the coalescing flush timer.
+
+        Bursts of mutations (e.g. marking all 16 rows of a chunk) collapse
+        into a single disk write ~250ms after the first one.
+        """
+        with self._lock:
+            self._dirty = True
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(0.25, self._flush_timer_fired)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _flush_timer_fired(self) -> None:
+        """Timer callback: clear the pending timer and flush."""
+        with self._lock:
+            self._flush_timer = None
+        self.flush()
+
+    def flush(self) -> None:
+        """Write pending progress changes to disk, if any."""
+        with self._lock:
+            if not self._dirty:
+                return
+            timer = self._flush_timer
+            self._flush_timer = None
+            if timer is not None:
+                timer.cancel()
+            # Only drop the dirty flag once the write lands, so a failed
+            # save is retried by the next flush instead of lost
+            if self.save_progress():
+                self._dirty = False
+
+    def save_progress(self) -> bool:
+        """Save progress to file.
+
+        Returns:
+            True if the file was written, False on error
+        """
+        with self._lock:
+            # Serialize masks and the chunk set back to the legacy list formats
+            self.progress["completed_rows"] = {
+                ref: [row for row in range(16) if mask & (1 << row)]
+                for ref, mask in self._row_masks.items()
+            }
+            self.progress["completed_chunks"] = sorted(self._completed_chunks)
+            try:
+                # Write to a sibling temp file and rename so a crash mid-write
+                # can never leave a truncated progress file behind
+                tmp_file = self.save_file + ".tmp"
+                with open(tmp_file, "w") as f:
+                    f.write(json_dumps(self.progress, indent=4))
+                os.replace(tmp_file, self.save_file)
+                return True
+            except Exception as e:
+                print(f"Error saving progress: {str(e)}")
+                return False
 
     def mark_row_complete(self, chunk_ref: str, row_num: int) -> None:
         """Mark a row as complete.
@@ -56,18 +147,21 @@ class ProgressTracker:
         if not 0 <= row_num <= 15:
             raise ValueError("Row number must be between 0 and 15")
 
-        if chunk_ref not in self.progress["completed_rows"]:
-            self.progress["completed_rows"][chunk_ref] = []
+        with self._lock:
+            mask = self._row_masks.get(chunk_ref, 0)
+            bit = 1 << row_num
+            if not mask & bit:
+                mask |= bit
+                self._row_masks[chunk_ref] = mask
+                self._completed_row_count += 1
+                self.progress["last_modified"][chunk_ref] = _now_iso()
 
-        if row_num not in self.progress["completed_rows"][chunk_ref]:
-            self.progress["completed_rows"][chunk_ref].append(row_num)
-            self.progress["last_modified"][chunk_ref] = datetime.now().isoformat()
+                # All rows complete: promote the chunk inline; the mask and
+                # counters are already accurate, so no second save is needed
+                if mask == 0xFFFF:
+                    self._completed_chunks.add(chunk_ref)
 
-            # Check if all rows are complete
-            if len(self.progress["completed_rows"][chunk_ref]) == 16:
-                self.mark_chunk_complete(chunk_ref)
-
-            self.save_progress()
+                self._schedule_save()
 
     def unmark_row_complete(self, chunk_ref: str, row_num: int) -> None:
         """Remove completed status from a row.
@@ -76,18 +170,18 @@ class ProgressTracker:
             chunk_ref: Chunk reference (e.g., 'A1')
             row_num: Row number to unmark
         """
-        if (
-            chunk_ref in self.progress["completed_rows"]
-            and row_num in self.progress["completed_rows"][chunk_ref]
-        ):
-            self.progress["completed_rows"][chunk_ref].remove(row_num)
-            
-            # If chunk was marked complete, unmark it
-            if chunk_ref in self.progress["completed_chunks"]:
-                self.progress["completed_chunks"].remove(chunk_ref)
-            
-            self.progress["last_modified"][chunk_ref] = datetime.now().isoformat()
-            self.save_progress()
+        with self._lock:
+            mask = self._row_masks.get(chunk_ref, 0)
+            bit = 1 << row_num
+            if mask & bit:
+                self._row_masks[chunk_ref] = mask & ~bit
+                self._completed_row_count -= 1
+
+                # If chunk was marked complete, unmark it
+                self._completed_chunks.discard(chunk_ref)
+
+                self.progress["last_modified"][chunk_ref] = _now_iso()
+                self._schedule_save()
 
     def mark_chunk_complete(self, chunk_ref: str) -> None:
         """Mark an entire chunk as complete.
@@ -95,12 +189,14 @@ class ProgressTracker:
         Args:
             chunk_ref: Chunk reference to mark complete
         """
-        if chunk_ref not in self.progress["completed_chunks"]:
-            self.progress["completed_chunks"].append(chunk_ref)
-            # Mark all rows in the chunk as complete
-            self.progress["completed_rows"][chunk_ref] = list(range(16))
-            self.progress["last_modified"][chunk_ref] = datetime.now().isoformat()
-            self.save_progress()
+        with self._lock:
+            if chunk_ref not in self._completed_chunks:
+                self._completed_chunks.add(chunk_ref)
+                # Mark all rows in the chunk as complete
+                self._completed_row_count += 16 - self._row_masks.get(chunk_ref, 0).bit_count()
+                self._row_masks[chunk_ref] = 0xFFFF
+                self.progress["last_modified"][chunk_ref] = _now_iso()
+                self._schedule_save()
 
     def unmark_chunk_complete(self, chunk_ref: str) -> None:
         """Remove completed status from a chunk.
@@ -108,12 +204,12 @@ class ProgressTracker:
         Args:
             chunk_ref: Chunk reference to unmark
         """
-        if chunk_ref in self.progress["completed_chunks"]:
-            self.progress["completed_chunks"].remove(chunk_ref)
-            if chunk_ref in self.progress["completed_rows"]:
-                del self.progress["completed_rows"][chunk_ref]
-            self.progress["last_modified"][chunk_ref] = datetime.now().isoformat()
-            self.save_progress()
+        with self._lock:
+            if chunk_ref in self._completed_chunks:
+                self._completed_chunks.discard(chunk_ref)
+                self._completed_row_count -= self._row_masks.pop(chunk_ref, 0).bit_count()
+                self.progress["last_modified"][chunk_ref] = _now_iso()
+                self._schedule_save()
 
     def get_completed_rows(self, chunk_ref: str) -> List[int]:
         """Get list of completed rows for a chunk.
@@ -124,7 +220,14 @@ class ProgressTracker:
         Returns:
             List of completed row numbers
         """
-        return sorted(self.progress["completed_rows"].get(chunk_ref, []))
+        mask = self._row_masks.get(chunk_ref, 0)
+        cached = self._rows_cache.get(chunk_ref)
+        if cached is not None and cached[0] == mask:
+            return cached[1]
+        rows = [row for row in range(16) if mask & (1 << row)]
+        # The mask doubles as the cache version: any mutation changes it
+        self._rows_cache[chunk_ref] = (mask, rows)
+        return rows
 
     def is_row_complete(self, chunk_ref: str, row_num: int) -> bool:
         """Check if a specific row is marked complete.
@@ -136,7 +239,7 @@ class ProgressTracker:
         Returns:
             True if row is marked complete, False otherwise
         """
-        return row_num in self.get_completed_rows(chunk_ref)
+        return bool(self._row_masks.get(chunk_ref, 0) & (1 << row_num))
 
     def is_chunk_complete(self, chunk_ref: str) -> bool:
         """Check if a chunk is marked complete.
@@ -147,7 +250,7 @@ class ProgressTracker:
         Returns:
             True if chunk is marked complete, False otherwise
         """
-        return chunk_ref in self.progress["completed_chunks"]
+        return chunk_ref in self._completed_chunks
 
     def get_completion_stats(self) -> Dict[str, Any]:
         """Get overall completion statistics.
@@ -155,14 +258,11 @@ class ProgressTracker:
         Returns:
             Dictionary containing completion statistics
         """
-        total_chunks = len(self.progress["completed_rows"])
-        completed_chunks = len(self.progress["completed_chunks"])
-        
-        total_rows = 0
-        completed_rows = 0
-        for chunk_rows in self.progress["completed_rows"].values():
-            total_rows += 16  # Each chunk has 16 rows
-            completed_rows += len(chunk_rows)
+        total_chunks = len(self._row_masks)
+        completed_chunks = len(self._completed_chunks)
+
+        total_rows = total_chunks * 16  # Each chunk has 16 rows
+        completed_rows = self._completed_row_count
 
         return {
             "total_chunks": total_chunks,
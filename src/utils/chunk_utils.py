@@ -89,7 +89,7 @@ def get_chunk_statistics(
         "total_blocks": 0,
         "block_types": defaultdict(int),
         "rows_complete": len(progress_tracker.get_completed_rows(chunk_ref)),
-        "is_chunk_complete": chunk_ref in progress_tracker.progress["completed_chunks"],
+        "is_chunk_complete": progress_tracker.is_chunk_complete(chunk_ref),
         "last_modified": progress_tracker.progress["last_modified"].get(
             chunk_ref, "Never"
         ),
@@ -0,0 +1,41 @@
+"""JSON serialization helpers with an optional orjson fast path."""
+import json
+from typing import Any
+
+try:
+    import orjson as _orjson
+except ImportError:
+    # orjson is an optional accelerator; stdlib json is the fallback
+    _orjson = None
+
+
+def json_loads(data: Any) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data: JSON document as str or bytes
+
+    Returns:
+        The parsed Python object
+    """
+    if _orjson is not None:
+        return _orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any, indent: int = 0) -> str:
+    """Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Indentation width, 0 for compact output. orjson only
+            supports two-space indentation, which is close enough for the
+            human-edited files.
+
+    Returns:
+        JSON document as a string
+    """
+    if _orjson is not None:
+        option = _orjson.OPT_INDENT_2 if indent else 0
+        return _orjson.dumps(obj, option=option).decode("utf-8")
+    return json.dumps(obj, indent=indent or None)